@@ -0,0 +1,86 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# LLM を使わないコマンドで読み込まれてはいけない重い依存
+HEAVY_MODULES = ["langchain", "langchain_core", "langchain_openai", "feedparser", "bs4"]
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# 計測対象: LLM を使わないコマンドの起動に必要な import
+TARGETS = {
+    "cli": "import ai_radio.cli; ai_radio.cli.build_parser()",
+    "publish": "import ai_radio.cli, ai_radio.podcast_uploader",
+    "tts": "import ai_radio.cli, ai_radio.tts_converter",
+}
+
+MEASURE_CODE = """
+import json, sys, time
+start = time.perf_counter()
+exec({code!r})
+elapsed = time.perf_counter() - start
+heavy = sorted(m for m in {heavy!r} if m in sys.modules)
+print(json.dumps({{"elapsed": elapsed, "heavy": heavy}}))
+"""
+
+
+def measure(name, code, repeat):
+    """新しいインタプリタで import 時間を計測し、読み込まれた重い依存を返す
+
+    import に失敗した場合は子プロセスのエラー出力を表示して None を返す。
+    """
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(SRC_DIR))
+    elapsed = []
+    heavy = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", MEASURE_CODE.format(code=code, heavy=HEAVY_MODULES)],
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        if result.returncode != 0:
+            print(f"{name}: NG: import failed")
+            print(result.stderr.rstrip())
+            return None
+        data = json.loads(result.stdout.strip().splitlines()[-1])
+        elapsed.append(data["elapsed"])
+        heavy = data["heavy"]
+    return statistics.median(elapsed), heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI import time")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs")
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=0.5,
+        help="Fail if the median import time exceeds this value",
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for name, code in TARGETS.items():
+        measured = measure(name, code, args.repeat)
+        if measured is None:
+            failed = True
+            continue
+        median, heavy = measured
+        print(f"{name}: {median * 1000:.1f} ms (median of {args.repeat})")
+        if heavy:
+            print(f"  NG: heavy modules imported: {', '.join(heavy)}")
+            failed = True
+        if median > args.max_seconds:
+            print(f"  NG: exceeds {args.max_seconds * 1000:.0f} ms")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,15 @@
-def filter_relevant_news(llm, news_entries):
+# 関心のある分野（チャンネルごとに上書き可能）
+DEFAULT_INTERESTS = [
+    "AI技術の最新動向",
+    "AIの活用事例",
+    "AIに関連する法規制、ガバナンス",
+]
+
+
+def filter_relevant_news(llm, news_entries, interests=None):
+    if interests is None:
+        interests = DEFAULT_INTERESTS
+
     # ニュースのリストを、生成AIに入力できるテキスト形式に整形
     # ニュースのリストは項番を付与され下記の形式に。
     #    1. タイトル：<ニュース1のタイトル>
@@ -12,14 +23,14 @@ def filter_relevant_news(llm, news_entries):
         ]
     )
 
+    interests_text = "\n".join(f"- {interest}" for interest in interests)
+
     # テキスト形式に整形されたニュースのリストと、指示文を合わせてプロンプトに変換
     prompt = f"""
 あなたはAIに関連する情報を収集するためのAIアシスタントです。以下のニュースリストの中から、私の関心に合致するものだけを選んでください。
 
 # 関心のある分野
-- AI技術の最新動向
-- AIの活用事例
-- AIに関連する法規制、ガバナンス
+{interests_text}
 
 # ニュースリスト
 {news_text}
@@ -40,10 +51,11 @@ def filter_relevant_news(llm, news_entries):
 
 
 if __name__ == "__main__":
-    from article_collector import get_today_news, rss_urls
     from dotenv import load_dotenv
     from langchain_openai import ChatOpenAI
 
+    from ai_radio.article_collector import get_today_news, rss_urls
+
     load_dotenv()
 
     llm = ChatOpenAI(model="gpt-4o-mini", temperature=0, timeout=60, max_retries=2)
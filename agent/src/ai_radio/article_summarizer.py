@@ -201,11 +201,12 @@ def summarize_articles(llm: BaseChatModel, news_entries):
 
 
 if __name__ == "__main__":
-    from article_collector import get_today_news, rss_urls
-    from article_selector import filter_relevant_news
     from dotenv import load_dotenv
     from langchain_openai import ChatOpenAI
 
+    from ai_radio.article_collector import get_today_news, rss_urls
+    from ai_radio.article_selector import filter_relevant_news
+
     load_dotenv()
 
     llm = ChatOpenAI(model="gpt-4o-mini", temperature=0, timeout=60, max_retries=2)
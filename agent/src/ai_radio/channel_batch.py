@@ -0,0 +1,132 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import yaml
+
+from ai_radio.article_collector import get_today_news, rss_urls
+from ai_radio.article_selector import DEFAULT_INTERESTS, filter_relevant_news
+from ai_radio.article_summarizer import summarize_articles
+from ai_radio.script_generator import generate_radio_script
+from ai_radio.tts_converter import ZUNDAMON_ID, text_to_speech
+
+# チャンネルを並列処理する最大数の既定値（VOICEVOXエンジンは1つのため小さくする）
+DEFAULT_MAX_WORKERS = 2
+
+# ロギング設定
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def load_channels(config_path):
+    """設定ファイルからチャンネル定義を読み込む"""
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+
+    channels = []
+    for channel in config.get("channels") or []:
+        if "name" not in channel or "output" not in channel:
+            raise ValueError(f"チャンネル定義には name と output が必要です: {channel}")
+        # 結果の上書きや同じファイルへの並列書き込みを防ぐため、重複は許可しない
+        for key in ("name", "output"):
+            if any(c[key] == channel[key] for c in channels):
+                raise ValueError(f"チャンネルの {key} が重複しています: {channel[key]}")
+        channels.append(
+            {
+                "name": channel["name"],
+                "interests": channel.get("interests") or DEFAULT_INTERESTS,
+                "speaker": channel.get("speaker", ZUNDAMON_ID),
+                "output": channel["output"],
+                "target_minutes": channel.get("target_minutes"),
+            }
+        )
+
+    if not channels:
+        raise ValueError(f"{config_path} にチャンネルが定義されていません")
+
+    feeds = config.get("feeds") or rss_urls
+    if not isinstance(feeds, dict):
+        raise ValueError(f"feeds は「名前: URL」の形式で指定してください: {feeds}")
+
+    return feeds, channels
+
+
+def select_for_channel(llm, news_entries, channel):
+    """チャンネルの関心に合わせてニュースを選択する"""
+    filtered_news = filter_relevant_news(llm, news_entries, channel["interests"])
+    logger.info(f"[{channel['name']}] 関心のあるニュースリスト: {len(filtered_news)}件")
+    return filtered_news
+
+
+def produce_channel(llm, articles, channel, compress=None):
+    """チャンネルの原稿を作成し、音声に変換する"""
+    radio_script = generate_radio_script(llm, articles)
+    logger.info(f"[{channel['name']}] ラジオ原稿作成完了")
+
+    target_minutes = channel["target_minutes"]
+    return text_to_speech(
+        radio_script,
+        channel["output"],
+        channel["speaker"],
+        target_seconds=target_minutes * 60 if target_minutes else None,
+        compress=compress,
+    )
+
+
+def run_batch(llm, feeds, channels, compress=None, max_workers=DEFAULT_MAX_WORKERS):
+    """収集・要約を一度だけ行い、選択・原稿作成・音声合成をチャンネルごとに並列実行する"""
+    news_entries = get_today_news(rss_urls=feeds)
+    logger.info(f"今日のニュースリスト: {len(news_entries)}件")
+
+    max_workers = max(1, min(max_workers, len(channels)))
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(select_for_channel, llm, news_entries, channel)
+            for channel in channels
+        ]
+
+        # 選択に失敗したチャンネルは以降の処理から外す
+        selections = []
+        for channel, future in zip(channels, futures):
+            try:
+                selections.append((channel, future.result()))
+            except Exception as e:
+                logger.error(
+                    f"[{channel['name']}] の記事選択中にエラーが発生しました: {e}"
+                )
+                results[channel["name"]] = None
+
+    # いずれかのチャンネルで選ばれた記事を重複なく集めて、まとめて要約する
+    unique_entries = {}
+    for _, filtered_news in selections:
+        for entry in filtered_news:
+            unique_entries.setdefault(entry["link"], entry)
+    logger.info(f"要約対象の記事: {len(unique_entries)}件")
+
+    summarized_news = summarize_articles(llm, list(unique_entries.values()))
+    summaries = {entry["link"]: entry for entry in summarized_news}
+    logger.info("ニュース要約完了")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                produce_channel,
+                llm,
+                [summaries[entry["link"]] for entry in filtered_news],
+                channel,
+                compress,
+            )
+            for channel, filtered_news in selections
+        ]
+
+        for (channel, _), future in zip(selections, futures):
+            try:
+                results[channel["name"]] = future.result()
+            except Exception as e:
+                logger.error(f"[{channel['name']}] の処理中にエラーが発生しました: {e}")
+                results[channel["name"]] = None
+
+    return results
@@ -0,0 +1,279 @@
+import json
+import logging
+import os
+import sys
+from argparse import ArgumentParser
+
+# ロギング設定
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# langchain・feedparser・bs4 などの重い依存は、それを使うサブコマンドの中でのみ import する。
+# publish や tts --script のように LLM を使わないコマンドの起動を速く保つため、
+# このモジュールのトップレベルに重い import を追加しないこと。
+
+
+def create_llm():
+    """パイプラインで使用する LLM を作成する"""
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(model="gpt-4o-mini", temperature=0, timeout=60, max_retries=2)
+
+
+def read_json(path):
+    """JSON ファイル（"-" の場合は標準入力）を読み込む"""
+    if path == "-":
+        return json.load(sys.stdin)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json(data, path):
+    """JSON ファイル（"-" の場合は標準出力）に書き込む"""
+    if path == "-":
+        json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+        return
+    output_dir = os.path.dirname(path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    logger.info(f"{path} に保存しました")
+
+
+def write_text(text, path):
+    """テキストファイル（"-" の場合は標準出力）に書き込む"""
+    if path == "-":
+        sys.stdout.write(text + "\n")
+        return
+    output_dir = os.path.dirname(path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    logger.info(f"{path} に保存しました")
+
+
+def collect(args):
+    from ai_radio.article_collector import get_today_news, rss_urls
+
+    news_entries = get_today_news(rss_urls=rss_urls)
+    logger.info(f"今日のニュースリスト: {len(news_entries)}件")
+    return news_entries
+
+
+def select(args, news_entries=None, llm=None):
+    from ai_radio.article_selector import filter_relevant_news
+
+    if news_entries is None:
+        news_entries = read_json(args.input)
+    filtered_news = filter_relevant_news(llm or create_llm(), news_entries)
+    logger.info(f"関心のあるニュースリスト: {len(filtered_news)}件")
+    return filtered_news
+
+
+def summarize(args, news_entries=None, llm=None):
+    from ai_radio.article_summarizer import summarize_articles
+
+    if news_entries is None:
+        news_entries = read_json(args.input)
+    summarized_news = summarize_articles(llm or create_llm(), news_entries)
+    logger.info("ニュース要約完了")
+    return summarized_news
+
+
+def script(args, articles=None, llm=None):
+    from ai_radio.script_generator import generate_radio_script
+
+    if articles is None:
+        articles = read_json(args.input)
+    radio_script = generate_radio_script(llm or create_llm(), articles)
+    logger.info("ラジオ原稿作成完了")
+    return radio_script
+
+
+def create_compressor(llm):
+    """原稿の行を LLM で圧縮する関数を作成する"""
+    from ai_radio.script_generator import compress_script_lines
+
+    return lambda lines, ratio: compress_script_lines(llm, lines, ratio)
+
+
+def tts(args, radio_script=None, llm=None):
+    from ai_radio.tts_converter import text_to_speech
+
+    if radio_script is None:
+        logger.info(f"指定されたスクリプトファイルを読み込み: {args.script}")
+        with open(args.script, "r", encoding="utf-8") as f:
+            radio_script = f.read()
+
+    # 目標時間が指定されていれば、音声合成の前に原稿の長さを調整する
+    target_seconds = args.target_minutes * 60 if args.target_minutes else None
+    compress = create_compressor(llm) if llm and target_seconds else None
+    return text_to_speech(
+        radio_script, args.output, target_seconds=target_seconds, compress=compress
+    )
+
+
+def publish(args, audio_file=None):
+    from ai_radio.podcast_uploader import create_podcast_post
+
+    return create_podcast_post(
+        audio_file=audio_file or args.audio,
+        title=args.title,
+        description=args.description,
+    )
+
+
+def run(args):
+    """収集から音声合成（必要に応じて投稿作成）までを一括で実行する"""
+    llm = create_llm()
+    news_entries = collect(args)
+    filtered_news = select(args, news_entries, llm)
+    summarized_news = summarize(args, filtered_news, llm)
+    radio_script = script(args, summarized_news, llm)
+    if args.script_output:
+        write_text(radio_script, args.script_output)
+    audio_file = tts(args, radio_script, llm)
+    if args.publish and audio_file:
+        publish(args, audio_file)
+    return audio_file
+
+
+def batch(args):
+    """チャンネル設定に従い、複数番組をまとめて生成する"""
+    from ai_radio.channel_batch import load_channels, run_batch
+
+    feeds, channels = load_channels(args.config)
+    llm = create_llm()
+    results = run_batch(
+        llm, feeds, channels, create_compressor(llm), max_workers=args.max_workers
+    )
+    for name, audio_file in results.items():
+        logger.info(f"[{name}] {audio_file or '生成失敗'}")
+    return results
+
+
+def build_parser():
+    parser = ArgumentParser(prog="ai-radio", description="AI radio podcast pipeline")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    collect_parser = subparsers.add_parser("collect", help="Collect today's news")
+    collect_parser.add_argument(
+        "--output", default="-", help="Path to save the news JSON (default: stdout)"
+    )
+
+    select_parser = subparsers.add_parser("select", help="Select relevant news")
+    select_parser.add_argument(
+        "--input", default="-", help="Path to the news JSON (default: stdin)"
+    )
+    select_parser.add_argument(
+        "--output", default="-", help="Path to save the selected news JSON"
+    )
+
+    summarize_parser = subparsers.add_parser("summarize", help="Summarize articles")
+    summarize_parser.add_argument(
+        "--input", default="-", help="Path to the selected news JSON (default: stdin)"
+    )
+    summarize_parser.add_argument(
+        "--output", default="-", help="Path to save the summarized news JSON"
+    )
+
+    script_parser = subparsers.add_parser("script", help="Generate radio script")
+    script_parser.add_argument(
+        "--input", default="-", help="Path to the summarized news JSON (default: stdin)"
+    )
+    script_parser.add_argument(
+        "--output", default="-", help="Path to save the radio script"
+    )
+
+    tts_parser = subparsers.add_parser("tts", help="Convert radio script to audio")
+    tts_parser.add_argument(
+        "--script", required=True, help="Path to read the radio script"
+    )
+    tts_parser.add_argument(
+        "--output", default="audio/test_episode.wav", help="Path to save the audio file"
+    )
+    tts_parser.add_argument(
+        "--target-minutes",
+        type=float,
+        help="Trim article sections so the episode fits this length",
+    )
+
+    publish_parser = subparsers.add_parser("publish", help="Create podcast post")
+    publish_parser.add_argument("--audio", required=True, help="Path to audio file")
+    publish_parser.add_argument("--title", help="Podcast episode title")
+    publish_parser.add_argument("--description", help="Episode description (optional)")
+
+    run_parser = subparsers.add_parser("run", help="Run the whole pipeline")
+    run_parser.add_argument(
+        "--output", default="audio/test_episode.wav", help="Path to save the audio file"
+    )
+    run_parser.add_argument("--script-output", help="Path to save the radio script")
+    run_parser.add_argument(
+        "--target-minutes",
+        type=float,
+        help="Compress or trim the script so the episode fits this length",
+    )
+    run_parser.add_argument(
+        "--publish", action="store_true", help="Create podcast post after synthesis"
+    )
+    run_parser.add_argument("--title", help="Podcast episode title")
+    run_parser.add_argument("--description", help="Episode description (optional)")
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="Run the pipeline for multiple channels"
+    )
+    batch_parser.add_argument(
+        "--config", default="agent/channels.yaml", help="Path to the channels config"
+    )
+    batch_parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=2,
+        help="Number of channels processed in parallel (default: 2)",
+    )
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    # デバッグモードが有効な場合はログレベルを変更
+    if args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+        logger.debug("デバッグモードが有効になりました")
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    if args.command == "collect":
+        write_json(collect(args), args.output)
+    elif args.command == "select":
+        write_json(select(args), args.output)
+    elif args.command == "summarize":
+        write_json(summarize(args), args.output)
+    elif args.command == "script":
+        write_text(script(args), args.output)
+    elif args.command == "tts":
+        if tts(args) is None:
+            return 1
+    elif args.command == "publish":
+        publish(args)
+    elif args.command == "run":
+        if run(args) is None:
+            return 1
+    elif args.command == "batch":
+        if None in batch(args).values():
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
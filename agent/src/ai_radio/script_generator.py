@@ -42,7 +42,7 @@ AIやテクノロジーに関するトレンド記事を紹介するラジオ番
 3. エンディング（まとめ、次回予告、お別れの挨拶）
 
 原稿はずんだもんキャラクターの口調で書いてください。語尾には「〜のだ」「〜なのだ」を使います。
-また、「記事1: タイトル」のように明確に記事の区切りを示してください。
+また、見出しは独立した行にし、各記事は「記事1: タイトル」、エンディングは「エンディング」で始まる見出しで区切ってください。
 
 記事情報:
 {articles_text}
@@ -66,13 +66,43 @@ AIやテクノロジーに関するトレンド記事を紹介するラジオ番
     return response.content
 
 
+def compress_script_lines(
+    llm: BaseChatModel,
+    lines: list[str],
+    ratio: float,
+) -> list[str]:
+    """原稿の各行を、指定した比率程度の長さに圧縮する"""
+    prompt = ChatPromptTemplate.from_messages(
+        messages=[
+            {
+                "role": "user",
+                "content": """
+以下はラジオ原稿の一部です。読み上げ時間を短くするため、内容の要点と口調（語尾の「〜のだ」「〜なのだ」など）を保ったまま、
+およそ{max_chars}文字以内に短くしてください。出力は短くした文章のみとし、改行は含めないでください。
+
+原稿:
+{text}
+""".strip(),
+            },
+        ]
+    )
+
+    # 各行を並列に圧縮
+    chain = prompt | llm
+    responses = chain.batch(
+        [{"text": line, "max_chars": max(1, int(len(line) * ratio))} for line in lines]
+    )
+    return [response.content for response in responses]
+
+
 if __name__ == "__main__":
-    from article_collector import get_today_news, rss_urls
-    from article_selector import filter_relevant_news
-    from article_summarizer import summarize_articles
     from dotenv import load_dotenv
     from langchain_openai import ChatOpenAI
 
+    from ai_radio.article_collector import get_today_news, rss_urls
+    from ai_radio.article_selector import filter_relevant_news
+    from ai_radio.article_summarizer import summarize_articles
+
     load_dotenv()
 
     llm = ChatOpenAI(model="gpt-4o-mini", temperature=0, timeout=60, max_retries=2)
@@ -0,0 +1,321 @@
+import logging
+import os
+import re
+import subprocess
+import tempfile
+
+import requests
+
+# ロギング設定
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# VOICEVOXエンジンのURL
+VOICEVOX_URL = "http://localhost:50021"
+# VOICEVOXエンジンへのリクエストのタイムアウト（秒）
+VOICEVOX_TIMEOUT = 120
+# ずんだもんのスピーカーID
+ZUNDAMON_ID = 1
+# 原稿の記事見出し（「記事1: タイトル」「## 2. 記事1: タイトル」など）と
+# エンディング見出し（「エンディング」「## 3. エンディング」など）
+ARTICLE_HEADING_PATTERN = re.compile(r"^[#*\s]*(?:\d+\.\s*)?記事\s*\d+")
+ENDING_HEADING_PATTERN = re.compile(r"^[#*\s]*(?:\d+\.\s*)?エンディング")
+# これより短いセグメントは圧縮しない
+MIN_COMPRESS_LENGTH = 40
+# 圧縮で短くする比率の下限（これ以上は記事セクションの削除で調整する）
+MIN_COMPRESS_RATIO = 0.3
+
+
+def create_audio_query(text, speaker_id):
+    """テキストから音声合成用クエリ（AudioQuery）を作成する"""
+    logger.debug(f"テキスト「{text[:30]}...」の音声合成クエリを作成中")
+    query_params = {"text": text, "speaker": speaker_id}
+    try:
+        query_response = requests.post(
+            f"{VOICEVOX_URL}/audio_query", params=query_params, timeout=VOICEVOX_TIMEOUT
+        )
+        query_response.raise_for_status()
+        return query_response.json()
+    except requests.RequestException as e:
+        logger.error(f"VOICEVOXサーバーとの通信中にエラーが発生: {e}")
+        raise
+
+
+def synthesize_audio(query_data, speaker_id):
+    """音声合成用クエリから音声データを生成する"""
+    logger.debug("音声を合成中")
+    synthesis_params = {"speaker": speaker_id}
+    try:
+        synthesis_response = requests.post(
+            f"{VOICEVOX_URL}/synthesis",
+            params=synthesis_params,
+            json=query_data,
+            timeout=VOICEVOX_TIMEOUT,
+        )
+        synthesis_response.raise_for_status()
+        return synthesis_response.content
+    except requests.RequestException as e:
+        logger.error(f"VOICEVOXサーバーとの通信中にエラーが発生: {e}")
+        raise
+
+
+def estimate_duration(query_data):
+    """AudioQueryのモーラ長・ポーズ長から音声の長さ（秒）を推定する"""
+    pause_length = query_data.get("pauseLength")
+    pause_length_scale = query_data.get("pauseLengthScale", 1.0)
+
+    total = query_data.get("prePhonemeLength", 0.0) + query_data.get(
+        "postPhonemeLength", 0.0
+    )
+    for accent_phrase in query_data.get("accent_phrases", []):
+        for mora in accent_phrase.get("moras", []):
+            total += (mora.get("consonant_length") or 0.0) + mora["vowel_length"]
+        pause_mora = accent_phrase.get("pause_mora")
+        if pause_mora:
+            if pause_length is not None:
+                total += pause_length * pause_length_scale
+            else:
+                total += pause_mora["vowel_length"] * pause_length_scale
+
+    return total / query_data.get("speedScale", 1.0)
+
+
+def plan_speech(lines, speaker_id, query_cache=None):
+    """各行のAudioQueryを作成し、推定再生時間とともに返す"""
+    if query_cache is None:
+        query_cache = {}
+
+    segments = []
+    for i, line in enumerate(lines):
+        logger.debug(f"計画中: 行 {i + 1}/{len(lines)}")
+        try:
+            # 同じテキストのクエリは再利用する
+            if line not in query_cache:
+                query_cache[line] = create_audio_query(line, speaker_id)
+            query_data = query_cache[line]
+        except Exception as e:
+            logger.error(f"行 '{line}' の処理中にエラーが発生しました: {e}")
+            continue
+
+        segments.append(
+            {
+                "text": line,
+                "query": query_data,
+                "duration": estimate_duration(query_data),
+            }
+        )
+
+    return segments
+
+
+def total_duration(segments):
+    """セグメント全体の推定再生時間（秒）を返す"""
+    return sum(segment["duration"] for segment in segments)
+
+
+def is_heading(text):
+    """記事またはエンディングの見出し行かどうかを判定する"""
+    return bool(
+        ARTICLE_HEADING_PATTERN.match(text) or ENDING_HEADING_PATTERN.match(text)
+    )
+
+
+def find_article_sections(segments):
+    """「記事N」の見出しから、各記事セクションのセグメント範囲を返す"""
+    boundaries = [
+        i for i, segment in enumerate(segments) if is_heading(segment["text"])
+    ]
+
+    sections = []
+    for start, end in zip(boundaries, boundaries[1:] + [len(segments)]):
+        if ARTICLE_HEADING_PATTERN.match(segments[start]["text"]):
+            sections.append((start, end))
+    return sections
+
+
+def fit_to_duration(
+    segments, target_seconds, speaker_id, compress=None, query_cache=None
+):
+    """推定再生時間が目標に収まるよう、セグメントを圧縮・削除する"""
+    if query_cache is None:
+        query_cache = {}
+
+    estimated = total_duration(segments)
+    logger.info(f"推定再生時間: {estimated:.1f}秒 (目標: {target_seconds:.1f}秒)")
+    if estimated <= target_seconds:
+        return segments
+
+    # 圧縮関数があれば、長いセグメントを目標との比率に合わせて短くしてもらう
+    if compress is not None:
+        targets = [
+            i
+            for i, segment in enumerate(segments)
+            # 見出しは記事セクションの削除に使うため圧縮しない
+            if len(segment["text"]) >= MIN_COMPRESS_LENGTH
+            and not is_heading(segment["text"])
+        ]
+        if targets:
+            # 見出しや短い行は縮まないため、圧縮対象の部分だけで比率を計算する
+            compressible = sum(segments[i]["duration"] for i in targets)
+            fixed = estimated - compressible
+            ratio = min(
+                1.0, max(MIN_COMPRESS_RATIO, (target_seconds - fixed) / compressible)
+            )
+            logger.info(
+                f"{len(targets)} 個のセグメントを圧縮します (比率: {ratio:.2f})"
+            )
+            try:
+                compressed_texts = compress(
+                    [segments[i]["text"] for i in targets], ratio
+                )
+            except Exception as e:
+                logger.error(f"セグメントの圧縮中にエラーが発生しました: {e}")
+                compressed_texts = []
+
+            segments = list(segments)
+            for i, text in zip(targets, compressed_texts):
+                text = text.strip()
+                if not text or text == segments[i]["text"]:
+                    continue
+                compressed = plan_speech([text], speaker_id, query_cache)
+                # 圧縮後の方が長い場合は元のセグメントを使う
+                if compressed and compressed[0]["duration"] < segments[i]["duration"]:
+                    segments[i] = compressed[0]
+
+            estimated = total_duration(segments)
+            logger.info(f"圧縮後の推定再生時間: {estimated:.1f}秒")
+
+    # それでも超える場合は、後ろの記事セクションから削除する（最低1記事は残す）
+    sections = find_article_sections(segments)
+    while estimated > target_seconds and len(sections) > 1:
+        start, end = sections.pop()
+        logger.info(f"記事セクション「{segments[start]['text'][:30]}」を削除します")
+        segments = segments[:start] + segments[end:]
+        estimated = total_duration(segments)
+
+    if estimated > target_seconds:
+        logger.warning(
+            f"推定再生時間 {estimated:.1f}秒 が目標 {target_seconds:.1f}秒 を超えています"
+        )
+    else:
+        logger.info(f"調整後の推定再生時間: {estimated:.1f}秒")
+
+    return segments
+
+
+def text_to_speech(
+    text, output_path, speaker_id=ZUNDAMON_ID, target_seconds=None, compress=None
+):
+    """テキストを音声に変換してファイルに保存する
+
+    target_seconds を指定すると、音声合成の前にAudioQueryから再生時間を推定し、
+    目標に収まるよう compress(texts, ratio) による圧縮や記事セクションの削除を行う。
+    """
+    logger.info(f"音声合成を開始: 出力先={output_path}")
+
+    # テキストを改行で分割
+    lines = [line.strip() for line in text.split("\n") if line.strip()]
+
+    if not lines:
+        logger.warning("変換するテキストがありません")
+        return None
+
+    logger.info(f"合計 {len(lines)} 行のテキストを処理します")
+
+    # 音声合成の前に全行のAudioQueryを作成し、再生時間を見積もる
+    query_cache = {}
+    segments = plan_speech(lines, speaker_id, query_cache)
+    if target_seconds is not None:
+        segments = fit_to_duration(
+            segments, target_seconds, speaker_id, compress, query_cache
+        )
+    else:
+        logger.info(f"推定再生時間: {total_duration(segments):.1f}秒")
+
+    # 一時ディレクトリを作成
+    with tempfile.TemporaryDirectory() as temp_dir:
+        logger.debug(f"一時ディレクトリを作成: {temp_dir}")
+        temp_files = []
+
+        # 各行を音声に変換（計画段階で作成したAudioQueryを再利用する）
+        for i, segment in enumerate(segments):
+            logger.info(f"処理中: 行 {i + 1}/{len(segments)}")
+            try:
+                audio_data = synthesize_audio(segment["query"], speaker_id)
+
+                # 一時ファイルに保存
+                temp_file = os.path.join(temp_dir, f"line_{i:04d}.wav")
+                with open(temp_file, "wb") as f:
+                    f.write(audio_data)
+
+                temp_files.append(temp_file)
+                logger.debug(f"一時ファイルを保存: {temp_file}")
+            except Exception as e:
+                logger.error(
+                    f"行 '{segment['text']}' の処理中にエラーが発生しました: {e}"
+                )
+
+        # 音声ファイルを結合
+        if temp_files:
+            # 出力ディレクトリが存在しない場合は作成
+            output_dir = os.path.dirname(output_path)
+            if output_dir and not os.path.exists(output_dir):
+                logger.debug(f"出力ディレクトリを作成: {output_dir}")
+                os.makedirs(output_dir)
+
+            # ffmpegのconcat用のファイルリストを作成
+            concat_list_path = os.path.join(temp_dir, "concat_list.txt")
+            with open(concat_list_path, "w") as f:
+                for temp_file in temp_files:
+                    f.write(f"file '{temp_file}'\n")
+
+            logger.info(f"FFmpegを使用して {len(temp_files)} 個の音声ファイルを結合中")
+
+            # ffmpegを使って結合
+            try:
+                ffmpeg_command = [
+                    "ffmpeg",
+                    "-f",
+                    "concat",
+                    "-safe",
+                    "0",
+                    "-i",
+                    concat_list_path,
+                    "-c",
+                    "copy",
+                    output_path,
+                ]
+                logger.debug(f"実行コマンド: {' '.join(ffmpeg_command)}")
+
+                # FFmpegの出力をキャプチャして、エラー時にログに記録
+                process = subprocess.run(
+                    ffmpeg_command,
+                    check=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
+
+                logger.info(f"音声が {output_path} に保存されました")
+                logger.debug(f"FFmpeg出力: {process.stderr}")
+                return output_path
+            except Exception as e:
+                logger.error(f"FFmpegでの結合中にエラーが発生しました: {e}")
+                logger.error(f"FFmpeg出力: {e.stderr}")
+                return None
+        else:
+            logger.warning("音声ファイルが生成されませんでした")
+            return None
+
+
+if __name__ == "__main__":
+    import sys
+
+    from ai_radio.cli import main
+
+    # `ai-radio tts` と同じ。ニュースの収集から行う場合は `ai-radio run` を使う
+    argv = sys.argv[1:]
+    debug = ["--debug"] if "--debug" in argv else []
+    sys.exit(main([*debug, "tts", *(arg for arg in argv if arg != "--debug")]))
@@ -0,0 +1,180 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from ai_radio import channel_batch
+
+NEWS_ENTRIES = [
+    {"title": "規制", "link": "https://example.com/1", "summary": "s1"},
+    {"title": "ツール", "link": "https://example.com/2", "summary": "s2"},
+    {"title": "その他", "link": "https://example.com/3", "summary": "s3"},
+]
+
+# 関心ごとに選ばれる記事のインデックス
+SELECTIONS = {"規制": [0, 1], "ツール": [1], "技術": [1, 2]}
+
+CHANNELS = [
+    {
+        "name": name,
+        "interests": [name],
+        "speaker": 1,
+        "output": f"audio/{name}.mp3",
+        "target_minutes": None,
+    }
+    for name in SELECTIONS
+]
+
+
+def fake_filter_relevant_news(llm, news_entries, interests):
+    return [news_entries[i] for i in SELECTIONS[interests[0]]]
+
+
+def fake_summarize_articles(llm, news_entries):
+    return [dict(entry, ai_summary=f"要約: {entry['title']}") for entry in news_entries]
+
+
+def fake_text_to_speech(text, output_path, speaker_id, **kwargs):
+    return output_path
+
+
+class LoadChannelsTest(unittest.TestCase):
+    def load(self, content):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = os.path.join(temp_dir, "channels.yaml")
+            with open(config_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            return channel_batch.load_channels(config_path)
+
+    def test_defaults(self):
+        feeds, channels = self.load("channels:\n  - name: a\n    output: a.mp3\n")
+
+        self.assertEqual(feeds, channel_batch.rss_urls)
+        self.assertEqual(channels[0]["interests"], channel_batch.DEFAULT_INTERESTS)
+        self.assertEqual(channels[0]["speaker"], channel_batch.ZUNDAMON_ID)
+        self.assertIsNone(channels[0]["target_minutes"])
+
+    def test_empty_channels(self):
+        with self.assertRaises(ValueError):
+            self.load("channels:\n")
+
+    def test_missing_output(self):
+        with self.assertRaises(ValueError):
+            self.load("channels:\n  - name: a\n")
+
+    def test_duplicate_name(self):
+        with self.assertRaises(ValueError):
+            self.load(
+                "channels:\n"
+                "  - name: a\n    output: a.mp3\n"
+                "  - name: a\n    output: b.mp3\n"
+            )
+
+    def test_duplicate_output(self):
+        with self.assertRaises(ValueError):
+            self.load(
+                "channels:\n"
+                "  - name: a\n    output: a.mp3\n"
+                "  - name: b\n    output: a.mp3\n"
+            )
+
+    def test_feeds_must_be_mapping(self):
+        with self.assertRaises(ValueError):
+            self.load(
+                "feeds:\n  - https://example.com/feed\n"
+                "channels:\n  - name: a\n    output: a.mp3\n"
+            )
+
+
+@mock.patch.object(channel_batch, "text_to_speech", side_effect=fake_text_to_speech)
+@mock.patch.object(channel_batch, "generate_radio_script", return_value="原稿")
+@mock.patch.object(
+    channel_batch, "summarize_articles", side_effect=fake_summarize_articles
+)
+@mock.patch.object(
+    channel_batch, "filter_relevant_news", side_effect=fake_filter_relevant_news
+)
+@mock.patch.object(channel_batch, "get_today_news", return_value=NEWS_ENTRIES)
+class RunBatchTest(unittest.TestCase):
+    def test_summarizes_union_once(
+        self,
+        get_today_news,
+        filter_relevant_news,
+        summarize_articles,
+        generate_radio_script,
+        text_to_speech,
+    ):
+        results = channel_batch.run_batch(None, {}, CHANNELS)
+
+        get_today_news.assert_called_once()
+        summarize_articles.assert_called_once()
+        summarized = summarize_articles.call_args.args[1]
+        self.assertEqual(
+            [entry["link"] for entry in summarized],
+            [entry["link"] for entry in NEWS_ENTRIES],
+        )
+
+        # 各チャンネルには、自分が選んだ記事の要約済みエントリが渡される
+        articles = [call.args[1] for call in generate_radio_script.call_args_list]
+        self.assertCountEqual(
+            [[article["ai_summary"] for article in call] for call in articles],
+            [
+                ["要約: 規制", "要約: ツール"],
+                ["要約: ツール"],
+                ["要約: ツール", "要約: その他"],
+            ],
+        )
+        self.assertEqual(
+            results, {channel["name"]: channel["output"] for channel in CHANNELS}
+        )
+
+    def test_selection_failure_is_isolated(
+        self,
+        get_today_news,
+        filter_relevant_news,
+        summarize_articles,
+        generate_radio_script,
+        text_to_speech,
+    ):
+        def filter_or_fail(llm, news_entries, interests):
+            if interests == ["規制"]:
+                raise RuntimeError("timeout")
+            return fake_filter_relevant_news(llm, news_entries, interests)
+
+        filter_relevant_news.side_effect = filter_or_fail
+        results = channel_batch.run_batch(None, {}, CHANNELS, max_workers=1)
+
+        self.assertEqual(
+            results,
+            {"規制": None, "ツール": "audio/ツール.mp3", "技術": "audio/技術.mp3"},
+        )
+        summarized = summarize_articles.call_args.args[1]
+        self.assertEqual(
+            [entry["link"] for entry in summarized],
+            [entry["link"] for entry in NEWS_ENTRIES[1:]],
+        )
+        self.assertEqual(text_to_speech.call_count, 2)
+
+    def test_production_failure_is_isolated(
+        self,
+        get_today_news,
+        filter_relevant_news,
+        summarize_articles,
+        generate_radio_script,
+        text_to_speech,
+    ):
+        def tts_or_fail(text, output_path, speaker_id, **kwargs):
+            if output_path == "audio/技術.mp3":
+                raise RuntimeError("VOICEVOX error")
+            return output_path
+
+        text_to_speech.side_effect = tts_or_fail
+        results = channel_batch.run_batch(None, {}, CHANNELS)
+
+        self.assertIsNone(results["技術"])
+        self.assertEqual(results["規制"], "audio/規制.mp3")
+        self.assertEqual(results["ツール"], "audio/ツール.mp3")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+import unittest
+from unittest import mock
+
+from ai_radio import tts_converter
+
+MORA = {"consonant_length": 0.05, "vowel_length": 0.1}
+
+
+def make_query(mora_count, pause_length=None, speed_scale=1.0):
+    """1モーラ0.15秒、ポーズ0.3秒、前後の無音0.1秒ずつのAudioQueryを作成する"""
+    return {
+        "accent_phrases": [
+            {"moras": [MORA] * mora_count, "pause_mora": {"vowel_length": 0.3}},
+            {"moras": [MORA] * mora_count, "pause_mora": None},
+        ],
+        "speedScale": speed_scale,
+        "prePhonemeLength": 0.1,
+        "postPhonemeLength": 0.1,
+        "pauseLength": pause_length,
+        "pauseLengthScale": 1.0,
+    }
+
+
+def fake_audio_query(text, speaker_id):
+    """テキストの文字数をモーラ数とみなしたAudioQueryを返す"""
+    return {
+        "accent_phrases": [{"moras": [MORA] * len(text), "pause_mora": None}],
+        "speedScale": 1.0,
+        "prePhonemeLength": 0.0,
+        "postPhonemeLength": 0.0,
+        "kana": text,
+    }
+
+
+SCRIPT_LINES = [
+    "オープニングなのだ",
+    "記事1: ひとつめ",
+    "あ" * 40,
+    "記事2: ふたつめ",
+    "い" * 40,
+    "記事3: みっつめ",
+    "う" * 40,
+    "エンディング",
+    "またねなのだ",
+]
+
+
+class HeadingPatternTest(unittest.TestCase):
+    def test_article_headings(self):
+        for text in [
+            "記事1: タイトル",
+            "### 記事1: タイトル",
+            "**記事2: タイトル**",
+            "## 2. 記事1: タイトル",
+        ]:
+            with self.subTest(text=text):
+                self.assertTrue(tts_converter.ARTICLE_HEADING_PATTERN.match(text))
+
+    def test_ending_headings(self):
+        for text in ["エンディング", "**エンディング**", "## 3. エンディング"]:
+            with self.subTest(text=text):
+                self.assertTrue(tts_converter.ENDING_HEADING_PATTERN.match(text))
+
+    def test_body_lines_are_not_headings(self):
+        for text in [
+            "記事を読んだのだ",
+            "オープニング",
+            "今日のエンディングテーマなのだ",
+        ]:
+            with self.subTest(text=text):
+                self.assertFalse(tts_converter.is_heading(text))
+
+
+class EstimateDurationTest(unittest.TestCase):
+    def test_pause_mora_vowel_length(self):
+        # 0.1 + 0.15 * 4 + 0.3 + 0.1
+        self.assertAlmostEqual(tts_converter.estimate_duration(make_query(2)), 1.1)
+
+    def test_pause_length_overrides_pause_mora(self):
+        query = make_query(2, pause_length=1.0)
+        self.assertAlmostEqual(tts_converter.estimate_duration(query), 1.8)
+
+    def test_speed_scale(self):
+        query = make_query(2, speed_scale=2.0)
+        self.assertAlmostEqual(tts_converter.estimate_duration(query), 0.55)
+
+
+@mock.patch.object(tts_converter, "create_audio_query", side_effect=fake_audio_query)
+class PlanSpeechTest(unittest.TestCase):
+    def test_audio_query_runs_once_per_text(self, create_audio_query):
+        segments = tts_converter.plan_speech(["あい", "うえお", "あい"], 1)
+
+        self.assertEqual(create_audio_query.call_count, 2)
+        self.assertEqual([s["text"] for s in segments], ["あい", "うえお", "あい"])
+        self.assertAlmostEqual(tts_converter.total_duration(segments), 1.05)
+
+    def test_synthesis_reuses_planned_queries(self, create_audio_query):
+        with (
+            mock.patch.object(
+                tts_converter, "synthesize_audio", return_value=b""
+            ) as synthesize_audio,
+            mock.patch.object(tts_converter.subprocess, "run"),
+        ):
+            output_path = tts_converter.text_to_speech(
+                "\n".join(SCRIPT_LINES), "out.wav", target_seconds=20
+            )
+
+        self.assertEqual(output_path, "out.wav")
+
+        # 計画段階の audio_query だけが実行され、合成ではそのクエリが使われる
+        self.assertEqual(create_audio_query.call_count, len(SCRIPT_LINES))
+        synthesized = [call.args[0]["kana"] for call in synthesize_audio.call_args_list]
+        self.assertEqual(synthesized, SCRIPT_LINES[:5] + SCRIPT_LINES[7:])
+
+
+@mock.patch.object(tts_converter, "create_audio_query", side_effect=fake_audio_query)
+class FitToDurationTest(unittest.TestCase):
+    def plan(self):
+        return tts_converter.plan_speech(SCRIPT_LINES, 1)
+
+    def test_find_article_sections(self, create_audio_query):
+        sections = tts_converter.find_article_sections(self.plan())
+        self.assertEqual(sections, [(1, 3), (3, 5), (5, 7)])
+
+    def test_within_target_is_unchanged(self, create_audio_query):
+        segments = self.plan()
+        fitted = tts_converter.fit_to_duration(segments, 100, 1)
+        self.assertEqual(fitted, segments)
+
+    def test_trims_from_last_article_keeping_ending(self, create_audio_query):
+        fitted = tts_converter.fit_to_duration(self.plan(), 20, 1)
+
+        texts = [segment["text"] for segment in fitted]
+        self.assertEqual(texts[:5], SCRIPT_LINES[:5])
+        self.assertEqual(texts[5:], ["エンディング", "またねなのだ"])
+
+    def test_keeps_at_least_one_article(self, create_audio_query):
+        fitted = tts_converter.fit_to_duration(self.plan(), 1, 1)
+
+        texts = [segment["text"] for segment in fitted]
+        self.assertEqual(texts, SCRIPT_LINES[:3] + ["エンディング", "またねなのだ"])
+
+    def test_numbered_ending_is_kept(self, create_audio_query):
+        lines = [*SCRIPT_LINES[:7], "## 3. エンディング", "またねなのだ"]
+        segments = tts_converter.plan_speech(lines, 1)
+        fitted = tts_converter.fit_to_duration(segments, 20, 1)
+
+        texts = [segment["text"] for segment in fitted]
+        self.assertEqual(texts, lines[:5] + lines[7:])
+
+    def test_long_headings_are_not_compressed(self, create_audio_query):
+        lines = [
+            line if not line.startswith("記事") else f"### {line}" + "長" * 50
+            for line in SCRIPT_LINES
+        ]
+        segments = tts_converter.plan_speech(lines, 1)
+
+        # 見出しの「記事N:」を落としてしまう圧縮関数
+        def compress(texts, ratio):
+            return [text.split(":")[-1] for text in texts]
+
+        compress = mock.Mock(side_effect=compress)
+        fitted = tts_converter.fit_to_duration(segments, 30, 1, compress)
+
+        compressed = compress.call_args.args[0]
+        self.assertFalse(any(tts_converter.is_heading(text) for text in compressed))
+        texts = [segment["text"] for segment in fitted]
+        self.assertEqual(texts[1], lines[1])
+        self.assertEqual(texts[-2:], ["エンディング", "またねなのだ"])
+        self.assertLess(len(fitted), len(lines))
+
+    def test_compress_ratio_uses_compressible_part_only(self, create_audio_query):
+        segments = self.plan()
+        # 圧縮できない見出し・短い行の合計は 48 モーラ、本文は 120 モーラ
+        fixed = sum(s["duration"] for s in segments if len(s["text"]) < 40)
+        target = fixed + 120 * 0.15 * 0.5
+
+        def compress(texts, ratio):
+            return [text[: int(len(text) * ratio)] for text in texts]
+
+        compress = mock.Mock(side_effect=compress)
+        fitted = tts_converter.fit_to_duration(segments, target, 1, compress)
+
+        self.assertAlmostEqual(compress.call_args.args[1], 0.5)
+        self.assertEqual(len(fitted), len(SCRIPT_LINES))
+        self.assertLessEqual(tts_converter.total_duration(fitted), target + 1e-9)
+
+    def test_compress_ratio_is_clamped(self, create_audio_query):
+        compress = mock.Mock(side_effect=lambda texts, ratio: texts)
+        tts_converter.fit_to_duration(self.plan(), 1, 1, compress)
+
+        self.assertEqual(compress.call_args.args[1], tts_converter.MIN_COMPRESS_RATIO)
+
+
+if __name__ == "__main__":
+    unittest.main()